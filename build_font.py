@@ -4,35 +4,82 @@ Build a pixel font from bitmap glyph definitions.
 Uses fonttools FontBuilder to create OTF output.
 
 Usage:
-    uv run python build_font.py glyph_data.yaml [output_dir]
+    uv run python build_font.py glyph_data.yaml [output_dir] [--cache]
 
 Outputs:
     output_dir/AbbotsMortonSpaceportMono.otf  - Monospace font
     output_dir/AbbotsMortonSpaceportSans.otf  - Proportional font
 """
 
+import argparse
+import hashlib
+import io
+import os
+import pickle
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import fontTools
 import yaml
 
 from fontTools.fontBuilder import FontBuilder
-from fontTools.pens.t2CharStringPen import T2CharStringPen
+from fontTools.misc.psCharStrings import T2CharString
 from fontTools.ttLib import newTable
 
+# Prefer the libyaml-backed loader; fall back to pure Python if it's unavailable
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
 
+
+POSTSCRIPT_GLYPH_NAMES_PATH = Path(__file__).parent / "inspo" / "postscript_glyph_names.yaml"
+
+
+@lru_cache(maxsize=None)
 def load_postscript_glyph_names() -> dict:
-    """Load PostScript glyph name to Unicode codepoint mapping from YAML."""
-    path = Path(__file__).parent / "inspo" / "postscript_glyph_names.yaml"
-    with open(path) as f:
-        return yaml.safe_load(f)
+    """
+    Load PostScript glyph name to Unicode codepoint mapping from YAML.
+    Cached, so the file is parsed at most once per process; don't mutate the result.
+    """
+    with open(POSTSCRIPT_GLYPH_NAMES_PATH, "rb") as f:
+        return yaml.load(f, Loader=YAMLLoader)
 
 
-def load_glyph_data(yaml_path: Path) -> dict:
-    """Load glyph definitions from YAML file."""
-    with open(yaml_path) as f:
-        return yaml.safe_load(f)
+def load_glyph_data(yaml_path: Path, cache_dir: Path | None = None) -> dict:
+    """
+    Load glyph definitions from YAML file.
+
+    If cache_dir is given, the parsed data is pickled there along with a hash
+    of the YAML's contents and reused for as long as the YAML is unchanged.
+    Each YAML file gets a single cache file, overwritten whenever it changes.
+    """
+    if cache_dir is None:
+        with open(yaml_path, "rb") as f:
+            return yaml.load(f, Loader=YAMLLoader)
+
+    raw = yaml_path.read_bytes()
+    digest = hashlib.blake2b(raw).hexdigest()
+    cache_path = cache_dir / f"{yaml_path.stem}.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_digest, cached_data = pickle.load(f)
+        if cached_digest == digest:
+            return cached_data
+    except Exception:
+        # Missing, truncated or incompatible caches are just misses
+        pass
+
+    glyph_data = yaml.load(raw, Loader=YAMLLoader)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".pkl.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump((digest, glyph_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return glyph_data
 
 
 def is_proportional_glyph(glyph_name: str) -> bool:
@@ -47,9 +94,9 @@ def get_base_glyph_name(prop_glyph_name: str) -> str:
     return prop_glyph_name
 
 
-def prepare_proportional_glyphs(glyphs_def: dict) -> dict:
+def prepare_proportional_glyphs(glyphs: dict) -> dict:
     """
-    Prepare glyph definitions for the proportional font variant.
+    Prepare precomputed glyphs (see precompute_glyphs) for the proportional font variant.
 
     For the proportional font:
     - .prop glyphs are renamed to their base names (e.g., uniE650.prop → uniE650)
@@ -57,97 +104,275 @@ def prepare_proportional_glyphs(glyphs_def: dict) -> dict:
     - Glyphs without .prop variants remain unchanged
     """
     # Find all base glyph names that have .prop variants
-    prop_base_names = set()
-    for glyph_name in glyphs_def.keys():
-        if is_proportional_glyph(glyph_name):
-            prop_base_names.add(get_base_glyph_name(glyph_name))
+    prop_base_names = {
+        glyph["base_name"] for glyph in glyphs.values() if glyph["is_prop"]
+    }
 
     # Build new glyph dict
     new_glyphs = {}
-    for glyph_name, glyph_def in glyphs_def.items():
-        if is_proportional_glyph(glyph_name):
+    for glyph_name, glyph in glyphs.items():
+        if glyph["is_prop"]:
             # Rename .prop glyph to its base name
-            base_name = get_base_glyph_name(glyph_name)
-            new_glyphs[base_name] = glyph_def
+            new_glyphs[glyph["base_name"]] = glyph
         elif glyph_name in prop_base_names:
             # Skip base glyphs that have .prop variants
             continue
         else:
             # Keep glyphs without .prop variants unchanged
-            new_glyphs[glyph_name] = glyph_def
+            new_glyphs[glyph_name] = glyph
 
     return new_glyphs
 
 
-def parse_bitmap(bitmap: list) -> list[list[int]]:
+# Year stamped into the copyright notice; read once rather than on every build
+_BUILD_YEAR = datetime.now().year
+
+# Matches uniXXXX glyph names, capturing the 4 hex digits
+_UNI_NAME_RE = re.compile(r"uni([0-9A-Fa-f]{4})")
+
+# Maps "#" and "1" to "1" and every other byte to "0", for parsing bitmap rows
+_BITMAP_TABLE = bytes(
+    ord('1') if i in (ord('#'), ord('1')) else ord('0') for i in range(256)
+)
+
+# Type 2 programs for .notdef (a 200x250 box at x=50) and the empty space
+# glyph, without the leading advance width, which depends on the metadata
+_NOTDEF_PROGRAM = [50, "hmoveto", 250, 200, -250, "vlineto", "endchar"]
+_SPACE_PROGRAM = ["endchar"]
+
+
+def parse_bitmap(bitmap: list) -> tuple[int, ...]:
     """
-    Convert bitmap to a 2D array of 0s and 1s.
+    Convert bitmap to one integer per row, with bit i set if column i is on.
     Accepts either string rows ("#" = on) or int arrays.
+    Results are memoized, so identical bitmaps are only parsed once.
     """
-    if not bitmap:
-        return []
+    return _parse_bitmap_rows(
+        tuple(row if isinstance(row, str) else tuple(row) for row in bitmap)
+    )
 
-    if isinstance(bitmap[0], str):
-        return [
-            [1 if c == '#' or c == '1' else 0 for c in row]
-            for row in bitmap
-        ]
-    return bitmap
 
+@lru_cache(maxsize=None)
+def _parse_bitmap_rows(rows: tuple) -> tuple[int, ...]:
+    """Cached body of parse_bitmap; rows must be hashable (strings or int tuples)."""
+    return tuple(
+        # Characters outside Latin-1 become "?", which maps to 0; the row is
+        # reversed so that column 0 ends up as the lowest bit
+        int(row.encode('latin-1', 'replace').translate(_BITMAP_TABLE)[::-1] or b"0", 2)
+        if isinstance(row, str) else sum(1 << i for i, c in enumerate(row) if c)
+        for row in rows
+    )
 
+
+@lru_cache(maxsize=None)
 def bitmap_to_rectangles(
-    bitmap: list[list[int]],
+    bitmap: tuple[int, ...],
     pixel_size: int,
     y_offset: int = 0
-) -> list[tuple[int, int, int, int]]:
+) -> tuple[tuple[int, int, int, int], ...]:
     """
-    Convert a 2D bitmap array to a list of rectangle coordinates.
+    Convert a 2D bitmap array to rectangle coordinates.
 
     Args:
-        bitmap: 2D array of 0s and 1s
+        bitmap: one bitmask per row, as returned by parse_bitmap
         pixel_size: size of each pixel in font units
         y_offset: vertical offset in pixels (negative for descenders)
                   0 = bottom of bitmap on baseline
                   -3 = bottom of bitmap is 3 pixels below baseline
 
-    Returns list of (x, y, width, height) tuples for each "on" pixel.
+    Returns a tuple of (x, y, width, height) tuples. Each horizontal run of
+    consecutive "on" pixels becomes one rectangle, and identical runs in
+    consecutive rows are merged into a single taller rectangle.
     Coordinates are in font units, with y=0 at baseline.
+    Results are memoized, so the returned tuple is shared between callers.
     """
     rectangles = []
     height = len(bitmap)
 
-    for row_idx, row in enumerate(bitmap):
-        # Flip y-axis: bitmap row 0 is top, font y increases upward
-        # y_offset shifts the whole glyph (negative = below baseline)
-        y = (y_offset + height - 1 - row_idx) * pixel_size
+    # Runs that may continue into the next row: (column, length) -> top row
+    open_runs = {}
+
+    # One extra pass past the last row closes every remaining run
+    for row_idx in range(height + 1):
+        runs = {}
+        mask = bitmap[row_idx] if row_idx < height else 0
+        while mask:
+            # Peel off the lowest run of "on" pixels: adding its lowest bit
+            # carries through the run and sets the bit just past its end
+            low_bit = mask & -mask
+            carried = mask + low_bit
+            col_idx = low_bit.bit_length() - 1
+            run_length = (carried & -carried).bit_length() - 1 - col_idx
+            runs[(col_idx, run_length)] = row_idx
+            mask &= carried
+
+        # Emit runs that stop at the previous row
+        for span in [span for span in open_runs if span not in runs]:
+            top_row = open_runs.pop(span)
+            col_idx, run_length = span
+            # Flip y-axis: bitmap row 0 is top, font y increases upward
+            # y_offset shifts the whole glyph (negative = below baseline)
+            y = (y_offset + height - row_idx) * pixel_size
+            rectangles.append((
+                col_idx * pixel_size,
+                y,
+                run_length * pixel_size,
+                (row_idx - top_row) * pixel_size,
+            ))
+
+        # Start tracking runs that don't continue one from the previous row
+        for span, top_row in runs.items():
+            open_runs.setdefault(span, top_row)
+
+    return tuple(rectangles)
+
+
+def rects_to_t2_program(
+    rectangles: list[tuple],
+    width: int = 0,
+    x_offset: int = 0
+) -> list:
+    """
+    Encode rectangles directly as a Type 2 CharString program.
+
+    Each rectangle becomes a relative moveto to its bottom-left corner
+    followed by one vlineto (up, right, down); the contour closes
+    implicitly. This is what T2CharStringPen plus the specializer would
+    produce for axis-aligned rectangles, without the pen bookkeeping.
+    """
+    program = [width]
+    current_x = current_y = 0
 
-        for col_idx, pixel in enumerate(row):
-            if pixel:  # Pixel is "on"
-                x = col_idx * pixel_size
-                rectangles.append((x, y, pixel_size, pixel_size))
+    for x, y, w, h in rectangles:
+        x += x_offset
+        dx = x - current_x
+        dy = y - current_y
+        if dy == 0:
+            program += (dx, "hmoveto")
+        elif dx == 0:
+            program += (dy, "vmoveto")
+        else:
+            program += (dx, dy, "rmoveto")
+        # Draw counter-clockwise for CFF (outer contour)
+        program += (h, w, -h, "vlineto")
+        # The contour ends at its bottom-right corner
+        current_x = x + w
+        current_y = y
 
-    return rectangles
+    program.append("endchar")
+    return program
 
 
-def draw_rectangles_to_glyph(rectangles: list[tuple], glyph_set):
+def draw_rectangles_to_glyph(
+    rectangles: list[tuple],
+    width: int = 0,
+    x_offset: int = 0
+) -> T2CharString:
     """
-    Draw rectangles as a TrueType glyph using T2CharStringPen.
+    Draw rectangles as a glyph outline.
     Returns a T2CharString for CFF/OTF fonts.
+
+    Args:
+        rectangles: (x, y, width, height) tuples in font units
+        width: advance width encoded in the CharString
+        x_offset: horizontal shift applied to every rectangle
     """
-    pen = T2CharStringPen(width=0, glyphSet=glyph_set)
+    # setupCFF fills in the font's private dict and global subrs
+    return T2CharString(program=rects_to_t2_program(rectangles, width, x_offset))
 
-    for x, y, w, h in rectangles:
-        # Draw counter-clockwise for CFF (outer contour)
-        pen.moveTo((x, y))
-        pen.lineTo((x, y + h))
-        pen.lineTo((x + w, y + h))
-        pen.lineTo((x + w, y))
-        pen.closePath()
 
-    return pen.getCharString()
+def validate_bitmap(glyph_name: str, bitmap: list, y_offset: int):
+    """
+    Check a glyph's bitmap dimensions, raising ValueError if they're wrong.
+
+    These are the checks for every variant the glyph can appear in: .prop
+    glyphs are only built into the proportional font, under their base
+    name, and everything else is built into the monospace font.
+    """
+    # Check if this is a Quikscript glyph (uniE6xx or uniE6xx.prop)
+    is_quikscript = glyph_name.partition(".")[0].startswith("uniE6")
+
+    # Validate bitmap width
+    if is_quikscript and not is_proportional_glyph(glyph_name):
+        # Monospace Quikscript glyphs: all rows must be exactly 5 characters wide
+        if not all(len(row) == 5 for row in bitmap):
+            row_idx, row = next(
+                (i, row) for i, row in enumerate(bitmap) if len(row) != 5
+            )
+            raise ValueError(
+                f"Glyph '{glyph_name}' row {row_idx} has width {len(row)}, expected 5"
+            )
+    elif len({len(row) for row in bitmap}) > 1:
+        # Proportional and non-Quikscript glyphs: all rows must have consistent width
+        row_widths = [len(row) for row in bitmap]
+        raise ValueError(
+            f"Glyph '{glyph_name}' has inconsistent row widths: {row_widths}"
+        )
+
+    # Validate bitmap height
+    row_count = len(bitmap)
+
+    if is_quikscript:
+        # Strict height validation for Quikscript glyphs
+        if get_base_glyph_name(glyph_name) in ("uniE66E", "uniE66F"):
+            if row_count != 12:
+                raise ValueError(
+                    f"Glyph '{glyph_name}' has {row_count} rows, expected 12 (angled parenthesis)"
+                )
+        elif y_offset == -3:
+            if row_count != 9:
+                raise ValueError(
+                    f"Glyph '{glyph_name}' has y_offset=-3 but bitmap has {row_count} rows, expected 9"
+                )
+        elif row_count not in (6, 9):
+            raise ValueError(
+                f"Glyph '{glyph_name}' has {row_count} rows, expected 6 or 9"
+            )
+    # Non-Quikscript glyphs: no height restrictions
 
 
-def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = False):
+def precompute_glyphs(glyphs_def: dict) -> dict:
+    """
+    Validate and parse every glyph definition once, for use by both font variants.
+
+    Returns a dict mapping each glyph name to a record with these keys:
+    - bitmap: parsed rows as returned by parse_bitmap (empty for empty glyphs)
+    - width: bitmap width in pixels
+    - y_offset: vertical offset in pixels (negative for descenders)
+    - advance_width: advance width in pixels, or None to use the default
+    - is_prop: whether the glyph is a .prop variant
+    - base_name: the glyph's name without any .prop suffix
+
+    Raises ValueError if a bitmap has the wrong width or height.
+    """
+    glyphs = {}
+
+    for glyph_name, glyph_def in glyphs_def.items():
+        bitmap = glyph_def.get("bitmap") or []
+        y_offset = glyph_def.get("y_offset", 0)  # negative for descenders
+
+        if bitmap:
+            validate_bitmap(glyph_name, bitmap, y_offset)
+
+        glyphs[glyph_name] = {
+            "bitmap": parse_bitmap(bitmap),
+            # Rows all have the same width once validated
+            "width": len(bitmap[0]) if bitmap else 0,
+            "y_offset": y_offset,
+            "advance_width": glyph_def.get("advance_width"),
+            "is_prop": is_proportional_glyph(glyph_name),
+            "base_name": get_base_glyph_name(glyph_name),
+        }
+
+    return glyphs
+
+
+def build_font(
+    glyph_data: dict,
+    output_path: Path,
+    is_proportional: bool = False,
+    glyphs: dict | None = None
+):
     """
     Build font from glyph data dictionary.
     Creates a CFF-based OpenType font (.otf).
@@ -157,13 +382,16 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
         output_path: Path to write the font file
         is_proportional: If True, build proportional font variant
                         (uses .prop glyphs as defaults, no ss01 feature)
+        glyphs: glyph_data["glyphs"] already run through precompute_glyphs,
+                so several variants can share one validation pass
     """
     metadata = glyph_data.get("metadata", {})
-    glyphs_def = glyph_data["glyphs"]
+    if glyphs is None:
+        glyphs = precompute_glyphs(glyph_data["glyphs"])
 
     # For proportional font, transform glyphs: .prop becomes default
     if is_proportional:
-        glyphs_def = prepare_proportional_glyphs(glyphs_def)
+        glyphs = prepare_proportional_glyphs(glyphs)
 
     # Font name differs for proportional variant
     base_font_name = metadata["font_name"]
@@ -182,30 +410,32 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
     # Build glyph order (must include .notdef first)
     # For mono font, exclude .prop glyphs entirely
     glyph_names = [
-        name for name in glyphs_def.keys()
+        name for name, glyph in glyphs.items()
         if name not in (".notdef", "space")
-        and (is_proportional or not is_proportional_glyph(name))
+        and (is_proportional or not glyph["is_prop"])
     ]
     glyph_order = [".notdef", "space"] + sorted(glyph_names)
 
     # Build character map (Unicode codepoint -> glyph name)
     # Exclude .prop glyphs - they have no direct Unicode mapping
     postscript_glyph_names = load_postscript_glyph_names()
-    cmap = {32: "space"}  # Always include space
-    for glyph_name, glyph_def in glyphs_def.items():
-        if is_proportional_glyph(glyph_name):
+    cmap_entries = [(32, "space")]  # Always include space
+    for glyph_name, glyph in glyphs.items():
+        if glyph["is_prop"] and not is_proportional:
             continue  # Proportional variants are accessed via ss01, not cmap
-        if len(glyph_name) == 1:
-            cmap[ord(glyph_name)] = glyph_name
-        elif glyph_name.startswith("uni") and len(glyph_name) == 7:
+        name_length = len(glyph_name)
+        if name_length == 1:
+            cmap_entries.append((ord(glyph_name), glyph_name))
+        elif name_length == 7 and glyph_name.startswith("uni"):
             # Handle uniXXXX naming convention (4 hex digits)
-            try:
-                codepoint = int(glyph_name[3:], 16)
-                cmap[codepoint] = glyph_name
-            except ValueError:
-                pass  # Not a valid hex code, skip
+            match = _UNI_NAME_RE.fullmatch(glyph_name)
+            if match:
+                cmap_entries.append((int(match.group(1), 16), glyph_name))
+            # Otherwise not a valid hex code, skip
         elif glyph_name in postscript_glyph_names:
-            cmap[postscript_glyph_names[glyph_name]] = glyph_name
+            cmap_entries.append((postscript_glyph_names[glyph_name], glyph_name))
+    # Later entries win for duplicate code points, as with item assignment
+    cmap = dict(cmap_entries)
 
     # Initialize FontBuilder for CFF-based OTF
     fb = FontBuilder(units_per_em, isTTF=False)
@@ -216,115 +446,54 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
     charstrings = {}
     metrics = {}
 
-    # Placeholder glyph set for pen (not strictly needed for simple drawing)
-    class GlyphSet:
-        pass
-    glyph_set = GlyphSet()
-
     # Standard monospace width: 7 pixels (bitmap 5 + 2 spacing)
     mono_width = 7 * pixel_size  # 350 units
 
     # Create .notdef glyph (simple rectangle, sized to fit mono_width)
-    pen = T2CharStringPen(width=mono_width, glyphSet=glyph_set)
-    pen.moveTo((50, 0))
-    pen.lineTo((50, 250))
-    pen.lineTo((250, 250))
-    pen.lineTo((250, 0))
-    pen.closePath()
-    charstrings[".notdef"] = pen.getCharString()
+    charstrings[".notdef"] = T2CharString(program=[mono_width] + _NOTDEF_PROGRAM)
     metrics[".notdef"] = (mono_width, 50)
 
     # Create space glyph (empty)
-    space_def = glyphs_def.get("space", {})
-    space_width = space_def["advance_width"] * pixel_size
-    pen = T2CharStringPen(width=space_width, glyphSet=glyph_set)
-    charstrings["space"] = pen.getCharString()
+    space_width = glyphs["space"]["advance_width"] * pixel_size
+    charstrings["space"] = T2CharString(program=[space_width] + _SPACE_PROGRAM)
     metrics["space"] = (space_width, 0)
 
+    # Glyphs with identical outlines and widths share one CharString,
+    # keyed by (bitmap, y_offset, advance_width, x_offset)
+    shared_charstrings = {}
+
     # Create all other glyphs
     for glyph_name in glyph_order:
         if glyph_name in (".notdef", "space"):
             continue
 
-        glyph_def = glyphs_def.get(glyph_name, {})
-        bitmap = glyph_def.get("bitmap", [])
-
-        # Validate bitmap width
-        # In proportional font, all glyphs use proportional validation
-        # In monospace font, only .prop suffixed glyphs use proportional validation
-        is_prop_glyph = is_proportional or is_proportional_glyph(glyph_name)
-        if bitmap:
-            if is_prop_glyph:
-                # Proportional glyphs: all rows must have consistent width
-                row_widths = [len(row) for row in bitmap]
-                if len(set(row_widths)) > 1:
-                    raise ValueError(
-                        f"Glyph '{glyph_name}' has inconsistent row widths: {row_widths}"
-                    )
-            else:
-                # Monospace glyphs: check width requirements
-                base_name = glyph_name.split(".")[0] if "." in glyph_name else glyph_name
-                is_quikscript_glyph = base_name.startswith("uniE6")
-                if is_quikscript_glyph:
-                    # Quikscript glyphs: all rows must be exactly 5 characters wide
-                    for row_idx, row in enumerate(bitmap):
-                        row_len = len(row)
-                        if row_len != 5:
-                            raise ValueError(
-                                f"Glyph '{glyph_name}' row {row_idx} has width {row_len}, expected 5"
-                            )
-                else:
-                    # Non-Quikscript glyphs: all rows must have consistent width
-                    row_widths = [len(row) for row in bitmap]
-                    if len(set(row_widths)) > 1:
-                        raise ValueError(
-                            f"Glyph '{glyph_name}' has inconsistent row widths: {row_widths}"
-                        )
+        glyph = glyphs[glyph_name]
+        bitmap = glyph["bitmap"]
 
         if not bitmap:
             # Empty glyph
-            pen = T2CharStringPen(width=mono_width, glyphSet=glyph_set)
-            charstrings[glyph_name] = pen.getCharString()
+            key = ((), 0, mono_width, 0)
+            if key not in shared_charstrings:
+                shared_charstrings[key] = draw_rectangles_to_glyph([], width=mono_width)
+            charstrings[glyph_name] = shared_charstrings[key]
             metrics[glyph_name] = (mono_width, 0)
             continue
 
-        # Parse and convert bitmap
-        bitmap = parse_bitmap(bitmap)
-        y_offset = glyph_def.get("y_offset", 0)  # negative for descenders
-
-        # Validate bitmap height
-        row_count = len(bitmap)
-
-        # Check if this is a Quikscript glyph (uniE6xx or uniE6xx.prop)
-        base_name = glyph_name.split(".")[0] if "." in glyph_name else glyph_name
-        is_quikscript = base_name.startswith("uniE6")
-
-        if is_quikscript:
-            # Strict height validation for Quikscript glyphs
-            if glyph_name in ("uniE66E", "uniE66F"):
-                if row_count != 12:
-                    raise ValueError(
-                        f"Glyph '{glyph_name}' has {row_count} rows, expected 12 (angled parenthesis)"
-                    )
-            elif y_offset == -3:
-                if row_count != 9:
-                    raise ValueError(
-                        f"Glyph '{glyph_name}' has y_offset=-3 but bitmap has {row_count} rows, expected 9"
-                    )
-            elif row_count not in (6, 9):
-                raise ValueError(
-                    f"Glyph '{glyph_name}' has {row_count} rows, expected 6 or 9"
-                )
-        # Non-Quikscript glyphs: no height restrictions
+        # In proportional font, all glyphs are proportional
+        # In monospace font, only .prop suffixed glyphs are proportional
+        is_prop_glyph = is_proportional or glyph["is_prop"]
+        y_offset = glyph["y_offset"]
 
         rectangles = bitmap_to_rectangles(bitmap, pixel_size, y_offset)
 
+        # Bitmap width in pixels
+        max_col = glyph["width"]
+
         # Calculate advance width
-        advance_width = glyph_def.get("advance_width")
+        advance_width = glyph["advance_width"]
         if advance_width is None:
             if is_prop_glyph:
                 # Proportional glyphs: bitmap width + 2 pixel spacing
-                max_col = max((len(row) for row in bitmap), default=0)
                 advance_width = (max_col + 2) * pixel_size
             else:
                 # Monospace glyphs: use fixed mono_width
@@ -333,7 +502,7 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
             advance_width *= pixel_size
 
         # Calculate x_offset: center glyph within advance width
-        bitmap_width = max((len(row) for row in bitmap), default=0) * pixel_size
+        bitmap_width = max_col * pixel_size
         x_offset = (advance_width - bitmap_width) // 2
 
         # Calculate left side bearing (LSB) with offset applied
@@ -342,16 +511,13 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
         else:
             lsb = x_offset
 
-        # Draw glyph with x_offset applied
-        pen = T2CharStringPen(width=advance_width, glyphSet=glyph_set)
-        for x, y, w, h in rectangles:
-            pen.moveTo((x + x_offset, y))
-            pen.lineTo((x + x_offset, y + h))
-            pen.lineTo((x + x_offset + w, y + h))
-            pen.lineTo((x + x_offset + w, y))
-            pen.closePath()
-
-        charstrings[glyph_name] = pen.getCharString()
+        # Draw glyph with x_offset applied, unless an identical one exists
+        key = (bitmap, y_offset, advance_width, x_offset)
+        if key not in shared_charstrings:
+            shared_charstrings[key] = draw_rectangles_to_glyph(
+                rectangles, width=advance_width, x_offset=x_offset
+            )
+        charstrings[glyph_name] = shared_charstrings[key]
         metrics[glyph_name] = (advance_width, lsb)
 
     # Setup CFF table
@@ -380,10 +546,12 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
     }
 
     if "copyright" in metadata:
-        copyright_str = metadata["copyright"]
-        if "© " in copyright_str:
-            year = datetime.now().year
-            copyright_str = copyright_str.replace("© ", f"© {year} ", 1)
+        # Insert the current year after the first "© "; partition only scans once
+        before, marker, after = metadata["copyright"].partition("© ")
+        if marker:
+            copyright_str = f"{before}© {_BUILD_YEAR} {after}"
+        else:
+            copyright_str = before
         name_strings["copyright"] = {"en": copyright_str}
     if "license" in metadata:
         name_strings["licenseDescription"] = {"en": metadata["license"]}
@@ -422,8 +590,13 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
     # Add head table (required)
     fb.setupHead(unitsPerEm=units_per_em, fontRevision=version)
 
-    # Save font initially
-    fb.save(str(output_path))
+    # Serialize in memory, then write the whole file at once and rename it
+    # into place so an interrupted build never leaves a truncated font behind
+    buffer = io.BytesIO()
+    fb.save(buffer)
+    temp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    temp_path.write_bytes(buffer.getvalue())
+    os.replace(temp_path, output_path)
 
     # Note: ss01 feature is no longer generated for mono font
     # since .prop glyphs are not included. The proportional font
@@ -438,22 +611,63 @@ def build_font(glyph_data: dict, output_path: Path, is_proportional: bool = Fals
     print(f"  Pixel size: {pixel_size} units")
 
 
+def build_inputs_digest(yaml_path: Path) -> str:
+    """
+    Hash everything that determines the built fonts: the glyph YAML, this
+    script, the PostScript glyph name table, the copyright year, and the
+    fontTools and PyYAML versions that load and serialize them.
+    """
+    digest = hashlib.blake2b()
+    for path in (yaml_path, Path(__file__), POSTSCRIPT_GLYPH_NAMES_PATH):
+        digest.update(path.read_bytes())
+    digest.update(str(_BUILD_YEAR).encode())
+    digest.update(f"fontTools {fontTools.version}\n".encode())
+    digest.update(f"PyYAML {yaml.__version__}\n".encode())
+    return digest.hexdigest()
+
+
+def get_digest_path(output_path: Path) -> Path:
+    """Get the sidecar file recording which inputs a font was built from."""
+    return output_path.with_name(output_path.name + ".hash")
+
+
+def is_up_to_date(output_path: Path, yaml_path: Path, digest: str) -> bool:
+    """Check if output_path was built from inputs matching digest and is newer than the YAML."""
+    try:
+        return (
+            get_digest_path(output_path).read_text().strip() == digest
+            and output_path.stat().st_mtime >= yaml_path.stat().st_mtime
+        )
+    except FileNotFoundError:
+        return False
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: uv run python build_font.py <glyph_data.yaml> [output_dir]")
-        print("\nOutputs:")
-        print("  output_dir/AbbotsMortonSpaceportMono.otf")
-        print("  output_dir/AbbotsMortonSpaceportSans.otf")
-        print("\nExample:")
-        print("  uv run python build_font.py glyph_data.yaml build/")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Build the Mono and Sans pixel fonts from bitmap glyph definitions"
+    )
+    parser.add_argument(
+        "glyph_data",
+        type=Path,
+        help="Path to glyph_data.yaml",
+    )
+    parser.add_argument(
+        "output_dir",
+        type=Path,
+        nargs="?",
+        default=Path("."),
+        help="Directory to write the fonts to (default: current directory)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the parsed YAML in output_dir/.cache/ and reuse it while the YAML is unchanged",
+    )
 
-    input_path = Path(sys.argv[1])
+    args = parser.parse_args()
 
-    if len(sys.argv) > 2:
-        output_dir = Path(sys.argv[2])
-    else:
-        output_dir = Path(".")
+    input_path = args.glyph_data
+    output_dir = args.output_dir
 
     if not input_path.exists():
         print(f"Error: Input file not found: {input_path}")
@@ -462,15 +676,30 @@ def main():
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    glyph_data = load_glyph_data(input_path)
-
-    # Build monospace font
     mono_path = output_dir / "AbbotsMortonSpaceportMono.otf"
-    build_font(glyph_data, mono_path, is_proportional=False)
-
-    # Build proportional font
     prop_path = output_dir / "AbbotsMortonSpaceportSans.otf"
-    build_font(glyph_data, prop_path, is_proportional=True)
+
+    # Skip variants whose inputs haven't changed since they were last built
+    digest = build_inputs_digest(input_path)
+    stale = []
+    for output_path, is_proportional in ((mono_path, False), (prop_path, True)):
+        if is_up_to_date(output_path, input_path, digest):
+            print(f"Font up to date: {output_path}")
+        else:
+            stale.append((output_path, is_proportional))
+
+    if not stale:
+        return
+
+    cache_dir = output_dir / ".cache" if args.cache else None
+    glyph_data = load_glyph_data(input_path, cache_dir)
+
+    # Validate and parse glyphs once; both variants build from the result
+    glyphs = precompute_glyphs(glyph_data["glyphs"])
+
+    for output_path, is_proportional in stale:
+        build_font(glyph_data, output_path, is_proportional=is_proportional, glyphs=glyphs)
+        get_digest_path(output_path).write_text(digest + "\n")
 
 
 if __name__ == "__main__":
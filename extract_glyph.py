@@ -18,6 +18,8 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
+from itertools import chain
 
 from fontTools.ttLib import TTFont
 from fontTools.pens.recordingPen import RecordingPen
@@ -25,6 +27,18 @@ from fontTools.pens.recordingPen import RecordingPen
 PIXEL_SIZE = 50
 
 
+@lru_cache(maxsize=8)
+def load_font(font_path):
+    """
+    Open a font once and reuse it across calls.
+
+    Returns:
+        tuple: (font, glyphset, hmtx) for the font at font_path
+    """
+    font = TTFont(font_path)
+    return font, font.getGlyphSet(), font["hmtx"]
+
+
 def extract_contours(recording):
     """Convert pen recording to list of polygon point lists."""
     contours = []
@@ -43,18 +57,48 @@ def extract_contours(recording):
     return contours
 
 
-def point_in_polygon(x, y, polygon):
-    """Ray casting algorithm for even-odd fill."""
-    n = len(polygon)
-    inside = False
-    j = n - 1
-    for i in range(n):
-        xi, yi = polygon[i]
-        xj, yj = polygon[j]
-        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-            inside = not inside
-        j = i
-    return inside
+def scanline_crossings(y, contours):
+    """
+    Find where a horizontal line at y crosses the contours' edges.
+
+    Returns the x coordinates of the crossings. A point on the line is
+    inside the glyph (even-odd fill) when an odd number of them lie at or
+    to its left, which lets one edge pass cover a whole bitmap row.
+    """
+    crossings = []
+    for polygon in contours:
+        xj, yj = polygon[-1]
+        for xi, yi in polygon:
+            if (yi > y) != (yj > y):
+                crossings.append((xj - xi) * (y - yi) / (yj - yi) + xi)
+            xj, yj = xi, yi
+    return crossings
+
+
+@lru_cache(maxsize=None)
+def draw_glyph(font_path, glyph_name):
+    """
+    Draw a glyph once and reuse its outline across calls.
+
+    Returns:
+        tuple: (contours, bounds) where contours is a tuple of polygons
+               (tuples of points) and bounds is (x_min, y_min, x_max, y_max),
+               or None if the glyph has no contours
+    """
+    _, glyphset, _ = load_font(font_path)
+
+    if glyph_name not in glyphset:
+        raise ValueError(f"Glyph '{glyph_name}' not found in font")
+
+    pen = RecordingPen()
+    glyphset[glyph_name].draw(pen)
+    contours = tuple(tuple(c) for c in extract_contours(pen.value))
+
+    if not contours:
+        return contours, None
+
+    all_x, all_y = zip(*chain.from_iterable(contours))
+    return contours, (min(all_x), min(all_y), max(all_x), max(all_y))
 
 
 def glyph_to_bitmap(font_path, glyph_name, include_padding=True):
@@ -71,29 +115,15 @@ def glyph_to_bitmap(font_path, glyph_name, include_padding=True):
                using '#' for filled pixels and ' ' for empty, and y_offset
                is the vertical offset in pixels (negative for descenders)
     """
-    font = TTFont(font_path)
-    glyphset = font.getGlyphSet()
-
-    if glyph_name not in glyphset:
-        raise ValueError(f"Glyph '{glyph_name}' not found in font")
-
-    glyph = glyphset[glyph_name]
-
-    pen = RecordingPen()
-    glyph.draw(pen)
-    contours = extract_contours(pen.value)
+    contours, bounds = draw_glyph(font_path, glyph_name)
 
     if not contours:
         return [], 0  # Empty glyph (like space)
 
-    # Get bounds
-    all_x = [pt[0] for c in contours for pt in c]
-    all_y = [pt[1] for c in contours for pt in c]
-    x_min, x_max = min(all_x), max(all_x)
-    y_min, y_max = min(all_y), max(all_y)
+    x_min, y_min, x_max, y_max = bounds
 
     # Get left_side_bearing for padding
-    hmtx = font["hmtx"]
+    _, _, hmtx = load_font(font_path)
     advance_width, lsb = hmtx[glyph_name]
 
     # Calculate grid dimensions
@@ -112,12 +142,17 @@ def glyph_to_bitmap(font_path, glyph_name, include_padding=True):
     bitmap = []
     for row in range(grid_height):
         y = y_max - (row * PIXEL_SIZE) - (PIXEL_SIZE // 2)
-        row_str = ""
+        crossings = sorted(scanline_crossings(y, contours))
+        # Walk the sorted crossings alongside the pixel centres: a pixel is
+        # filled when it lies between an odd and the next even crossing
+        passed = 0
+        row_chars = []
         for col in range(grid_width):
             x = (grid_x_start + col) * PIXEL_SIZE + (PIXEL_SIZE // 2)
-            count = sum(1 for c in contours if point_in_polygon(x, y, c))
-            row_str += "#" if count % 2 == 1 else " "
-        bitmap.append(row_str)
+            while passed < len(crossings) and crossings[passed] <= x:
+                passed += 1
+            row_chars.append("#" if passed % 2 == 1 else " ")
+        bitmap.append("".join(row_chars))
 
     # Calculate y_offset (how many pixels below baseline)
     y_offset = int(y_min / PIXEL_SIZE)
@@ -132,23 +167,12 @@ def get_glyph_metrics(font_path, glyph_name):
     Returns:
         dict with keys: advance_width, xMin, yMin, xMax, yMax, left_side_bearing
     """
-    font = TTFont(font_path)
-    glyphset = font.getGlyphSet()
-
-    if glyph_name not in glyphset:
-        raise ValueError(f"Glyph '{glyph_name}' not found in font")
-
-    glyph = glyphset[glyph_name]
+    contours, bounds = draw_glyph(font_path, glyph_name)
 
     # Get advance width from hmtx table
-    hmtx = font["hmtx"]
+    _, _, hmtx = load_font(font_path)
     advance_width, lsb = hmtx[glyph_name]
 
-    # Get bounds by drawing
-    pen = RecordingPen()
-    glyph.draw(pen)
-    contours = extract_contours(pen.value)
-
     if not contours:
         return {
             "advance_width": advance_width,
@@ -159,15 +183,14 @@ def get_glyph_metrics(font_path, glyph_name):
             "left_side_bearing": lsb,
         }
 
-    all_x = [pt[0] for c in contours for pt in c]
-    all_y = [pt[1] for c in contours for pt in c]
+    x_min, y_min, x_max, y_max = bounds
 
     return {
         "advance_width": advance_width,
-        "xMin": int(min(all_x)),
-        "yMin": int(min(all_y)),
-        "xMax": int(max(all_x)),
-        "yMax": int(max(all_y)),
+        "xMin": int(x_min),
+        "yMin": int(y_min),
+        "xMax": int(x_max),
+        "yMax": int(y_max),
         "left_side_bearing": lsb,
     }
 
@@ -196,8 +219,8 @@ def compare_glyphs(glyph_name, font1_path, font2_path):
     bitmap2, y_offset2 = glyph_to_bitmap(font2_path, glyph_name)
 
     # Get font names for display
-    font1_name = TTFont(font1_path)["name"].getDebugName(1) or "Font1"
-    font2_name = TTFont(font2_path)["name"].getDebugName(1) or "Font2"
+    font1_name = load_font(font1_path)[0]["name"].getDebugName(1) or "Font1"
+    font2_name = load_font(font2_path)[0]["name"].getDebugName(1) or "Font2"
 
     # Truncate names for display
     font1_short = font1_name[:20]
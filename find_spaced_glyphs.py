@@ -14,9 +14,7 @@ import argparse
 import sys
 import unicodedata
 
-from fontTools.ttLib import TTFont
-
-from extract_glyph import glyph_to_bitmap
+from extract_glyph import PIXEL_SIZE, draw_glyph, glyph_to_bitmap, load_font
 
 
 # Punctuation Unicode categories
@@ -60,31 +58,39 @@ def get_bitmap_width(bitmap):
     return max_col - min_col + 1
 
 
+def get_outline_width(font_path, glyph_name):
+    """
+    Calculate the content width of a glyph in pixels from its outline bounds.
+
+    For pixel-aligned outlines this equals get_bitmap_width() of the
+    rasterized glyph, without rasterizing it.
+    """
+    _, bounds = draw_glyph(font_path, glyph_name)
+    if bounds is None:
+        return 0  # Empty glyph
+
+    x_min, _, x_max, _ = bounds
+    return max(0, round((x_max - x_min) / PIXEL_SIZE))
+
+
 def get_punctuation_glyphs(font_path):
     """
     Get all punctuation glyph names and their Unicode code points from a font.
 
     Returns a list of (glyph_name, unicode_codepoint) tuples.
     """
-    font = TTFont(font_path)
+    font, _, _ = load_font(font_path)
     cmap = font.getBestCmap()
 
-    punctuation_glyphs = []
-
-    for codepoint, glyph_name in cmap.items():
-        try:
-            char = chr(codepoint)
-            category = unicodedata.category(char)
-            if category in PUNCTUATION_CATEGORIES:
-                punctuation_glyphs.append((glyph_name, codepoint))
-        except (ValueError, OverflowError):
-            # Skip invalid codepoints
-            pass
-
-    return sorted(punctuation_glyphs, key=lambda x: x[1])
+    # cmap code points are always valid, so chr() can't fail here
+    return [
+        (glyph_name, codepoint)
+        for codepoint, glyph_name in sorted(cmap.items())
+        if unicodedata.category(chr(codepoint)) in PUNCTUATION_CATEGORIES
+    ]
 
 
-def find_spaced_glyphs(font_path, max_width=4):
+def find_spaced_glyphs(font_path, max_width=4, verify_bitmap=False):
     """
     Find punctuation glyphs with bitmap width less than standard monospace.
 
@@ -92,6 +98,9 @@ def find_spaced_glyphs(font_path, max_width=4):
         font_path: Path to the OTF font file
         max_width: Maximum bitmap width to consider "spaced out" (default 4,
                    since standard monospace is 5 pixels)
+        verify_bitmap: If True, measure widths from rasterized bitmaps
+                       instead of outline bounds (slower, but doesn't
+                       assume pixel-aligned outlines)
 
     Returns:
         List of dicts with keys: name, width, unicode
@@ -101,8 +110,11 @@ def find_spaced_glyphs(font_path, max_width=4):
 
     for glyph_name, codepoint in punctuation_glyphs:
         try:
-            bitmap, _ = glyph_to_bitmap(font_path, glyph_name)
-            width = get_bitmap_width(bitmap)
+            if verify_bitmap:
+                bitmap, _ = glyph_to_bitmap(font_path, glyph_name)
+                width = get_bitmap_width(bitmap)
+            else:
+                width = get_outline_width(font_path, glyph_name)
 
             if 0 < width <= max_width:
                 spaced_glyphs.append({
@@ -150,11 +162,16 @@ def main():
         default=4,
         help="Maximum bitmap width to consider 'spaced out' (default: 4)",
     )
+    parser.add_argument(
+        "--verify-bitmap",
+        action="store_true",
+        help="Measure widths by rasterizing each glyph instead of from outline bounds",
+    )
 
     args = parser.parse_args()
 
     print(f"Analyzing font: {args.font_path}")
-    spaced_glyphs = find_spaced_glyphs(args.font_path, args.max_width)
+    spaced_glyphs = find_spaced_glyphs(args.font_path, args.max_width, args.verify_bitmap)
 
     print(f"Found {len(spaced_glyphs)} spaced-out glyphs:")
     for glyph in spaced_glyphs: